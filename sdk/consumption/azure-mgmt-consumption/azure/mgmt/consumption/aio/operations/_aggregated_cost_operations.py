@@ -5,6 +5,8 @@
 # Code generated by Microsoft (R) AutoRest Code Generator.
 # Changes may cause incorrect behavior and will be lost if the code is regenerated.
 # --------------------------------------------------------------------------
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any, Callable, Dict, Generic, Optional, TypeVar
 import warnings
 
@@ -12,12 +14,33 @@ from azure.core.exceptions import ClientAuthenticationError, HttpResponseError,
 from azure.core.pipeline import PipelineResponse
 from azure.core.pipeline.transport import AsyncHttpResponse, HttpRequest
 from azure.mgmt.core.exceptions import ARMErrorFormat
+from msrest import Serializer
 
 from ... import models as _models
 
 T = TypeVar('T')
 ClsType = Optional[Callable[[PipelineResponse[HttpRequest, AsyncHttpResponse], T, Dict[str, Any]], Any]]
 
+# Constant query and header parameters shared by all the requests of this operation group
+_API_VERSION_QUERY = "?api-version=2019-10-01"
+_ACCEPT_HEADER = {'Accept': "application/json", 'Accept-Encoding': "gzip, deflate"}
+_BASE_ERROR_MAP = MappingProxyType({
+    401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
+})
+
+_URL_SERIALIZER = Serializer()
+_URL_SERIALIZER.client_side_validation = False  # Same as the client serializer
+
+@lru_cache(maxsize=1024, typed=True)
+def _serialize_cached_url(name, data, data_type):
+    return _URL_SERIALIZER.url(name, data, data_type)
+
+def _serialize_url(name, data, data_type):
+    # The same management groups are usually queried over and over, only plain string ids are cached
+    if not isinstance(data, str):
+        return _URL_SERIALIZER.url(name, data, data_type)
+    return _serialize_cached_url(name, data, data_type)
+
 class AggregatedCostOperations:
     """AggregatedCostOperations async operations.
 
@@ -62,36 +85,30 @@ class AggregatedCostOperations:
         :raises: ~azure.core.exceptions.HttpResponseError
         """
         cls = kwargs.pop('cls', None)  # type: ClsType["_models.ManagementGroupAggregatedCostResult"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-        api_version = "2019-10-01"
-        accept = "application/json"
+        error_map = _BASE_ERROR_MAP
+        error_map_overrides = kwargs.pop('error_map', None)
+        if error_map_overrides:
+            error_map = {**_BASE_ERROR_MAP, **error_map_overrides}
 
         # Construct URL
         url = self.get_by_management_group.metadata['url']  # type: ignore
         path_format_arguments = {
-            'managementGroupId': self._serialize.url("management_group_id", management_group_id, 'str'),
+            'managementGroupId': _serialize_url("management_group_id", management_group_id, 'str'),
         }
         url = self._client.format_url(url, **path_format_arguments)
 
         # Construct parameters
-        query_parameters = {}  # type: Dict[str, Any]
-        query_parameters['api-version'] = self._serialize.query("api_version", api_version, 'str')
+        url += _API_VERSION_QUERY
         if filter is not None:
-            query_parameters['$filter'] = self._serialize.query("filter", filter, 'str')
+            url += "&$filter=" + self._serialize.query("filter", filter, 'str')
 
-        # Construct headers
-        header_parameters = {}  # type: Dict[str, Any]
-        header_parameters['Accept'] = self._serialize.header("accept", accept, 'str')
-
-        request = self._client.get(url, query_parameters, header_parameters)
+        request = HttpRequest("GET", url, headers=_ACCEPT_HEADER)
         pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
         response = pipeline_response.http_response
+        status_code = response.status_code
 
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if status_code != 200:
+            map_error(status_code=status_code, response=response, error_map=error_map)
             error = self._deserialize(_models.ErrorResponse, response)
             raise HttpResponseError(response=response, model=error, error_format=ARMErrorFormat)
 
@@ -122,35 +139,26 @@ class AggregatedCostOperations:
         :raises: ~azure.core.exceptions.HttpResponseError
         """
         cls = kwargs.pop('cls', None)  # type: ClsType["_models.ManagementGroupAggregatedCostResult"]
-        error_map = {
-            401: ClientAuthenticationError, 404: ResourceNotFoundError, 409: ResourceExistsError
-        }
-        error_map.update(kwargs.pop('error_map', {}))
-        api_version = "2019-10-01"
-        accept = "application/json"
+        error_map = _BASE_ERROR_MAP
+        error_map_overrides = kwargs.pop('error_map', None)
+        if error_map_overrides:
+            error_map = {**_BASE_ERROR_MAP, **error_map_overrides}
 
         # Construct URL
         url = self.get_for_billing_period_by_management_group.metadata['url']  # type: ignore
         path_format_arguments = {
-            'managementGroupId': self._serialize.url("management_group_id", management_group_id, 'str'),
-            'billingPeriodName': self._serialize.url("billing_period_name", billing_period_name, 'str'),
+            'managementGroupId': _serialize_url("management_group_id", management_group_id, 'str'),
+            'billingPeriodName': _serialize_url("billing_period_name", billing_period_name, 'str'),
         }
         url = self._client.format_url(url, **path_format_arguments)
 
-        # Construct parameters
-        query_parameters = {}  # type: Dict[str, Any]
-        query_parameters['api-version'] = self._serialize.query("api_version", api_version, 'str')
-
-        # Construct headers
-        header_parameters = {}  # type: Dict[str, Any]
-        header_parameters['Accept'] = self._serialize.header("accept", accept, 'str')
-
-        request = self._client.get(url, query_parameters, header_parameters)
+        request = HttpRequest("GET", url + _API_VERSION_QUERY, headers=_ACCEPT_HEADER)
         pipeline_response = await self._client._pipeline.run(request, stream=False, **kwargs)
         response = pipeline_response.http_response
+        status_code = response.status_code
 
-        if response.status_code not in [200]:
-            map_error(status_code=response.status_code, response=response, error_map=error_map)
+        if status_code != 200:
+            map_error(status_code=status_code, response=response, error_map=error_map)
             error = self._deserialize(_models.ErrorResponse, response)
             raise HttpResponseError(response=response, model=error, error_format=ARMErrorFormat)
 
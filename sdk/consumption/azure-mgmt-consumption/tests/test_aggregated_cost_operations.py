@@ -0,0 +1,115 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import json
+
+import pytest
+
+from azure.core.credentials import AccessToken
+from azure.core.pipeline.transport import HttpResponse, HttpTransport
+from azure.mgmt.consumption import ConsumptionManagementClient
+from azure.mgmt.consumption.operations import _aggregated_cost_operations
+from azure.mgmt.consumption.aio.operations import _aggregated_cost_operations as _aio_aggregated_cost_operations
+
+
+class MockCredential(object):
+    def get_token(self, *scopes, **kwargs):
+        return AccessToken("token", 2 ** 40)
+
+
+class MockResponse(HttpResponse):
+    def __init__(self, request, body):
+        super(MockResponse, self).__init__(request, None)
+        self.status_code = 200
+        self.headers = {"Content-Type": "application/json"}
+        self.content_type = "application/json"
+        self._body = json.dumps(body).encode("utf-8")
+
+    def body(self):
+        return self._body
+
+
+class MockTransport(HttpTransport):
+    def __init__(self):
+        self.requests = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        self.requests.append(request)
+        return MockResponse(request, {"id": "id", "properties": {"azureCharges": 1.5}})
+
+
+@pytest.fixture
+def transport():
+    return MockTransport()
+
+
+@pytest.fixture
+def client(transport):
+    return ConsumptionManagementClient(MockCredential(), "subscription_id", transport=transport)
+
+
+def test_get_by_management_group_quoting(client, transport):
+    result = client.aggregated_cost.get_by_management_group("mg/1 é?", filter="properties/usageStart ge '2021'")
+    assert result.azure_charges == 1.5
+    assert transport.requests[-1].url == (
+        "https://management.azure.com/providers/Microsoft.Management/managementGroups/mg%2F1%20%C3%A9%3F"
+        "/providers/Microsoft.Consumption/aggregatedcost?api-version=2019-10-01"
+        "&$filter=properties%2FusageStart%20ge%20%272021%27"
+    )
+
+
+def test_get_for_billing_period_by_management_group_quoting(client, transport):
+    client.aggregated_cost.get_for_billing_period_by_management_group("mg 1", "2021/01")
+    assert transport.requests[-1].url == (
+        "https://management.azure.com/providers/Microsoft.Management/managementGroups/mg%201"
+        "/providers/Microsoft.Billing/billingPeriods/2021%2F01/Microsoft.Consumption/aggregatedcost"
+        "?api-version=2019-10-01"
+    )
+
+
+def test_none_path_parameter(client, transport):
+    # Client side validation is disabled on the client, a missing value fails in msrest serialization
+    with pytest.raises(ValueError, match="No value for given attribute"):
+        client.aggregated_cost.get_by_management_group(None)
+    with pytest.raises(ValueError, match="No value for given attribute"):
+        client.aggregated_cost.get_for_billing_period_by_management_group("mg", None)
+    assert not transport.requests
+
+
+@pytest.mark.parametrize("operations_module", [_aggregated_cost_operations, _aio_aggregated_cost_operations])
+def test_url_serializer(operations_module):
+    assert operations_module._URL_SERIALIZER.client_side_validation is False
+    assert operations_module._serialize_url("management_group_id", "mg/1 é?", "str") == "mg%2F1%20%C3%A9%3F"
+    with pytest.raises(ValueError, match="No value for given attribute"):
+        operations_module._serialize_url("management_group_id", None, "str")
+
+
+@pytest.mark.parametrize("operations_module", [_aggregated_cost_operations, _aio_aggregated_cost_operations])
+def test_url_serializer_cache(operations_module):
+    operations_module._serialize_cached_url.cache_clear()
+    assert operations_module._serialize_url("billing_period_name", "2021", "str") == "2021"
+    assert operations_module._serialize_url("billing_period_name", "2021", "str") == "2021"
+    assert operations_module._serialize_cached_url.cache_info().hits == 1
+    # Other values are not cached: 1 and True are equal keys, lists are not hashable
+    assert operations_module._serialize_url("billing_period_name", 1, "int") == "1"
+    assert operations_module._serialize_url("billing_period_name", True, "bool") == "true"
+    assert operations_module._serialize_url("billing_period_name", ["a", "b"], "[str]") == (
+        operations_module._URL_SERIALIZER.url("billing_period_name", ["a", "b"], "[str]")
+    )
+    assert operations_module._serialize_cached_url.cache_info().currsize == 1
@@ -55,6 +55,13 @@ def _get_response_type(pipeline_transport_response):
             return RestTrioRequestsTransportResponse
     except ImportError:
         pass
+    try:
+        from .transport import TrioHttpxTransportResponse
+        from ..rest._httpx_trio import RestTrioHttpxTransportResponse
+        if isinstance(pipeline_transport_response, TrioHttpxTransportResponse):
+            return RestTrioHttpxTransportResponse
+    except ImportError:
+        pass
     raise ValueError("Unknown transport response")
 
 def to_rest_response(pipeline_transport_response):
@@ -48,6 +48,11 @@ from azure.core.exceptions import (
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from ._base import SansIOHTTPPolicy
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 if TYPE_CHECKING:
     from azure.core.pipeline.transport import HttpResponse, AsyncHttpResponse
 
@@ -57,6 +62,19 @@ HTTPRequestType = TypeVar("HTTPRequestType")
 HTTPResponseType = TypeVar("HTTPResponseType")
 
 
+def _json_loads(data):
+    # type: (str) -> Any
+    """Load JSON with orjson if installed, the standard library otherwise.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except ValueError:
+            # orjson is stricter than the standard library (NaN, integers over 64 bits...)
+            pass
+    return json.loads(data)
+
+
 class HeadersPolicy(SansIOHTTPPolicy):
     """A simple policy that sends the given headers with the request.
 
@@ -556,7 +574,7 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
 
         if cls.JSON_REGEXP.match(mime_type):
             try:
-                return json.loads(data_as_str)
+                return _json_loads(data_as_str)
             except ValueError as err:
                 raise DecodeError(message="JSON is invalid: {}".format(err), response=response, error=err)
         elif "xml" in (mime_type or []):
@@ -55,6 +55,8 @@ try:
             __all__.extend([
                 'TrioRequestsTransport',
                 'TrioRequestsTransportResponse',
+                'TrioHttpxTransport',
+                'TrioHttpxTransportResponse',
                 'AioHttpTransport',
                 'AioHttpTransportResponse',
             ])
@@ -87,6 +89,18 @@ try:
                         return TrioRequestsTransportResponse
                     except ImportError:
                         raise ImportError("trio package is not installed")
+                if name == 'TrioHttpxTransport':
+                    try:
+                        from ._httpx_trio import TrioHttpxTransport
+                        return TrioHttpxTransport
+                    except ImportError:
+                        raise ImportError("trio and httpx packages are not installed")
+                if name == 'TrioHttpxTransportResponse':
+                    try:
+                        from ._httpx_trio import TrioHttpxTransportResponse
+                        return TrioHttpxTransportResponse
+                    except ImportError:
+                        raise ImportError("trio and httpx packages are not installed")
                 return name
 
         else:
@@ -100,6 +114,16 @@ try:
             except ImportError:
                 pass  # Trio not installed
 
+            try:
+                from ._httpx_trio import TrioHttpxTransport, TrioHttpxTransportResponse
+
+                __all__.extend([
+                    'TrioHttpxTransport',
+                    'TrioHttpxTransportResponse'
+                ])
+            except ImportError:
+                pass  # Trio or httpx not installed
+
             try:
                 from ._aiohttp import AioHttpTransport, AioHttpTransportResponse
 
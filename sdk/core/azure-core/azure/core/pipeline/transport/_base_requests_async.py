@@ -23,11 +23,107 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+import requests
+from urllib3.util.retry import Retry # type: ignore
 
 from ._requests_basic import RequestsTransport
 from ._base_async import AsyncHttpTransport
+from ._bigger_block_size_http_adapters import BiggerBlockSizeHTTPAdapter
+
+# Async transports issue many requests concurrently from worker threads, size the pools accordingly
+_POOL_CONNECTIONS = max(10, (os.cpu_count() or 1) * 4)
+_POOL_MAXSIZE = 100
+
+# Adapters (and so connection pools) shared by the transports created with share_connection_pool=True.
+# requests applies the verify and cert settings to the pooled connections, so pools are only shared
+# between transports using the same settings: keyed by (verify, cert)
+_SHARED_ADAPTERS = {}  # type: Dict[Tuple[Any, Any], _SharedAdapter]
+_SHARED_ADAPTERS_LOCK = threading.Lock()
+
+
+class _SharedAdapter(object):  # pylint: disable=too-few-public-methods
+    def __init__(self, adapter):
+        # type: (BiggerBlockSizeHTTPAdapter) -> None
+        self.adapter = adapter
+        self.refcount = 0
+
+
+def _create_adapter():
+    # type: () -> BiggerBlockSizeHTTPAdapter
+    disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
+    return BiggerBlockSizeHTTPAdapter(
+        pool_connections=_POOL_CONNECTIONS,
+        pool_maxsize=_POOL_MAXSIZE,
+        max_retries=disable_retries
+    )
+
+
+def _acquire_shared_adapter(key):
+    # type: (Tuple[Any, Any]) -> BiggerBlockSizeHTTPAdapter
+    with _SHARED_ADAPTERS_LOCK:
+        shared = _SHARED_ADAPTERS.get(key)
+        if shared is None:
+            shared = _SHARED_ADAPTERS[key] = _SharedAdapter(_create_adapter())
+        shared.refcount += 1
+        return shared.adapter
+
+
+def _release_shared_adapter(key):
+    # type: (Tuple[Any, Any]) -> None
+    with _SHARED_ADAPTERS_LOCK:
+        shared = _SHARED_ADAPTERS[key]
+        shared.refcount -= 1
+        if shared.refcount == 0:
+            del _SHARED_ADAPTERS[key]
+            shared.adapter.close()
+
 
 class RequestsAsyncTransportBase(RequestsTransport, AsyncHttpTransport):
+    """Base class for the requests based asynchronous transports.
+
+    Each transport owning its session uses its own requests.Session, mounted with an adapter
+    sized for concurrent requests.
+
+    :keyword bool share_connection_pool: If True, the session created by this transport uses a
+     connection pool shared by the transports created with this option and the same
+     connection_verify and connection_cert, so connections are reused across transports.
+     Cookies, headers, auth and proxies stay per session. Defaults to False.
+    """
+    def __init__(self, **kwargs):
+        self._share_connection_pool = kwargs.pop('share_connection_pool', False)
+        self._shared_adapter_key = None  # type: Optional[Tuple[Any, Any]]
+        super(RequestsAsyncTransportBase, self).__init__(**kwargs)
+
+    def _init_session(self, session):
+        session.trust_env = self._use_env_settings
+        if self._share_connection_pool:
+            cert = self.connection_config.cert
+            self._shared_adapter_key = (
+                self.connection_config.verify,
+                tuple(cert) if isinstance(cert, list) else cert
+            )
+            adapter = _acquire_shared_adapter(self._shared_adapter_key)
+        else:
+            adapter = _create_adapter()
+        for p in self._protocols:
+            session.mount(p, adapter)
+
+    def close(self):
+        if self._session_owner and self.session:
+            if self._shared_adapter_key is not None:
+                # Unmount the shared adapter first, closing the session must not close the pool of other transports
+                for p in self._protocols:
+                    self.session.adapters.pop(p, None)
+                _release_shared_adapter(self._shared_adapter_key)
+                self._shared_adapter_key = None
+            self.session.close()
+            self._session_owner = False
+            self.session = None
+
     async def _retrieve_request_data(self, request):
         if hasattr(request.data, '__aiter__'):
             # Need to consume that async generator, since requests can't do anything with it
@@ -0,0 +1,347 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from collections.abc import AsyncIterator
+import logging
+from typing import Any, Dict, Optional, AsyncIterator as AsyncIteratorType
+from urllib.parse import urlparse
+from urllib.request import getproxies, proxy_bypass
+import trio
+import httpx
+
+from azure.core.configuration import ConnectionConfiguration
+from azure.core.exceptions import DecodeError, ServiceRequestError, ServiceResponseError
+from azure.core.pipeline import Pipeline
+
+from ._base import HttpRequest
+from ._base_async import (
+    AsyncHttpTransport,
+    AsyncHttpResponse)
+from .._tools import get_block_size as _get_block_size, get_internal_response as _get_internal_response
+
+try:
+    import h2  # pylint: disable=unused-import
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
+
+_LOGGER = logging.getLogger(__name__)
+
+# Concurrent requests share a few connections (a single one with HTTP/2), keep the pool bounded
+_MAX_CONNECTIONS = 100
+_MAX_KEEPALIVE_CONNECTIONS = 50
+
+
+_END_OF_BODY = object()
+
+
+async def _iterate_file(data, block_size):
+    while True:
+        chunk = await trio.to_thread.run_sync(data.read, block_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+async def _iterate_sync_iterable(data):
+    iterator = iter(data)
+    while True:
+        chunk = await trio.to_thread.run_sync(next, iterator, _END_OF_BODY)
+        if chunk is _END_OF_BODY:
+            return
+        yield chunk
+
+
+def _get_content(data, block_size):
+    """Adapt a request body to what httpx.AsyncClient accepts.
+
+    httpx refuses sync iterables and file-like objects on an AsyncClient, they are read in
+    worker threads so trio is not blocked by the I/O.
+    """
+    if data is None or isinstance(data, (bytes, str)) or hasattr(data, '__aiter__'):
+        return data
+    if hasattr(data, 'read'):
+        return _iterate_file(data, block_size)
+    return _iterate_sync_iterable(data)
+
+
+class TrioHttpxStreamDownloadGenerator(AsyncIterator):
+    """Streams the response body data.
+
+    :param pipeline: The pipeline object
+    :param response: The response object.
+    :param bool decompress: If True which is default, will attempt to decode the body based
+        on the *content-encoding* header.
+    """
+    def __init__(self, pipeline: Pipeline, response: AsyncHttpResponse, *, decompress=True) -> None:
+        self.pipeline = pipeline
+        self.request = response.request
+        self.response = response
+        self.block_size = _get_block_size(response)
+        self._internal_response = _get_internal_response(response)
+        if decompress:
+            self._iter_content = self._internal_response.aiter_bytes(self.block_size)
+        else:
+            self._iter_content = self._internal_response.aiter_raw(self.block_size)
+        self.content_length = int(response.headers.get('Content-Length', 0))
+
+    def __len__(self):
+        return self.content_length
+
+    async def __anext__(self):
+        internal_response = self._internal_response
+        try:
+            return await self._iter_content.__anext__()
+        except StopAsyncIteration:
+            await internal_response.aclose()
+            raise
+        except Exception as err:
+            _LOGGER.warning("Unable to stream download: %s", err)
+            await internal_response.aclose()
+            if isinstance(err, httpx.DecodingError):
+                raise DecodeError(err, response=self.response, error=err) from err
+            if isinstance(err, httpx.TransportError):
+                raise ServiceResponseError(err, error=err) from err
+            raise
+
+
+class TrioHttpxTransportResponse(AsyncHttpResponse):
+    """Methods for accessing response body data.
+
+    :param request: The HttpRequest object
+    :type request: ~azure.core.pipeline.transport.HttpRequest
+    :param httpx_response: Returned from AsyncClient.send().
+    :type httpx_response: httpx.Response object
+    :param block_size: block size of data sent over connection.
+    :type block_size: int
+    """
+    def __init__(self, request: HttpRequest, httpx_response: httpx.Response, block_size=None) -> None:
+        super(TrioHttpxTransportResponse, self).__init__(request, httpx_response, block_size=block_size)
+        self.status_code = httpx_response.status_code
+        self.headers = httpx_response.headers
+        self.reason = httpx_response.reason_phrase
+        self.content_type = httpx_response.headers.get('content-type')
+
+    def body(self) -> bytes:
+        """Return the whole body as bytes in memory.
+        """
+        try:
+            return self.internal_response.content
+        except httpx.ResponseNotRead:
+            raise ValueError("Body is not available. Call async method load_body, or do your call with stream=False.")
+
+    async def load_body(self) -> None:
+        """Load in memory the body, so it could be accessible from sync methods."""
+        await self.internal_response.aread()
+
+    def stream_download(self, pipeline, **kwargs) -> AsyncIteratorType[bytes]:
+        """Generator for streaming response body data.
+
+        :param pipeline: The pipeline object
+        :type pipeline: azure.core.pipeline.Pipeline
+        :keyword bool decompress: If True which is default, will attempt to decode the body based
+            on the *content-encoding* header.
+        """
+        return TrioHttpxStreamDownloadGenerator(pipeline, self, **kwargs)
+
+
+class TrioHttpxTransport(AsyncHttpTransport):
+    """httpx HTTP sender implementation for the trio event loop.
+
+    Unlike TrioRequestsTransport, requests are not offloaded to worker threads:
+    the I/O is multiplexed directly on the trio event loop by httpx.
+
+    SSL verification and client certificates are settings of the underlying
+    httpx client, so they can only be configured when creating the transport.
+
+    When HTTP/2 is enabled, concurrent requests to the same host are multiplexed
+    over a single connection instead of requiring one connection each.
+
+    :keyword session: The httpx client to use instead of the default one.
+    :paramtype session: httpx.AsyncClient
+    :keyword bool session_owner: Decide if the session provided by user is owned by this transport. Default to True.
+    :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword bool http2: Negotiate HTTP/2 with the service. Defaults to True if the "h2" package is installed.
+    """
+    def __init__(
+        self, *, session: Optional[httpx.AsyncClient] = None, session_owner=True, http2: Optional[bool] = None, **kwargs
+    ):
+        self._session_owner = session_owner
+        self.session = session
+        self._http2 = _HTTP2_AVAILABLE if http2 is None else http2
+        self.connection_config = ConnectionConfiguration(**kwargs)
+        self._use_env_settings = kwargs.pop('use_env_settings', True)
+        # Clients created for the "proxies" option of send and the environment proxies, by proxy URL
+        self._proxy_sessions = {}  # type: Dict[str, httpx.AsyncClient]
+        # Proxies from the environment, by scheme, used with the session owned by this transport
+        self._env_proxies = {}  # type: Dict[str, str]
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):  # pylint: disable=arguments-differ
+        await self.close()
+
+    async def open(self):
+        """Opens the connection.
+        """
+        if not self.session and self._session_owner:
+            if self._use_env_settings:
+                # httpx ignores the environment proxies when given a transport, they are applied in send
+                self._env_proxies = getproxies()
+            self.session = httpx.AsyncClient(
+                transport=self._create_transport(),
+                trust_env=self._use_env_settings,
+            )
+
+    async def close(self):
+        """Closes the connection.
+        """
+        for proxy_session in self._proxy_sessions.values():
+            await proxy_session.aclose()
+        self._proxy_sessions.clear()
+        if self._session_owner and self.session:
+            await self.session.aclose()
+            self._session_owner = False
+            self.session = None
+
+    async def sleep(self, duration):
+        await trio.sleep(duration)
+
+    def _create_transport(self, proxy: Optional[str] = None) -> httpx.AsyncHTTPTransport:
+        return httpx.AsyncHTTPTransport(
+            verify=self._build_ssl_config(self.connection_config.cert, self.connection_config.verify),
+            trust_env=self._use_env_settings,
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=_MAX_CONNECTIONS,
+                max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+            ),
+            proxy=proxy,
+            retries=0,
+        )
+
+    def _get_proxy_session(self, proxy: str) -> httpx.AsyncClient:
+        proxy_session = self._proxy_sessions.get(proxy)
+        if proxy_session is None:
+            proxy_session = self._proxy_sessions[proxy] = httpx.AsyncClient(
+                transport=self._create_transport(proxy),
+                trust_env=self._use_env_settings,
+            )
+        return proxy_session
+
+    def _get_env_proxy(self, url: str) -> Optional[str]:
+        parsed_url = urlparse(url)
+        proxy = self._env_proxies.get(parsed_url.scheme) or self._env_proxies.get('all')
+        if not proxy or proxy_bypass(parsed_url.hostname):
+            return None
+        return proxy if '://' in proxy else 'http://' + proxy
+
+    def _build_ssl_config(self, cert, verify):  # pylint: disable=no-self-use
+        if cert or verify not in (True, False):
+            import ssl
+            if verify not in (True, False):
+                ssl_ctx = ssl.create_default_context(cafile=verify)
+            else:
+                ssl_ctx = ssl.create_default_context()
+            if cert:
+                if isinstance(cert, str):
+                    ssl_ctx.load_cert_chain(cert)
+                else:
+                    ssl_ctx.load_cert_chain(*cert)
+            return ssl_ctx
+        return verify
+
+    async def send(self, request: HttpRequest, **config: Any) -> AsyncHttpResponse:  # type: ignore
+        """Send the request using this HTTP sender.
+
+        Will pre-load the body into memory to be available with a sync method.
+        Pass stream=True to avoid this behavior.
+
+        :param request: The HttpRequest object
+        :type request: ~azure.core.pipeline.transport.HttpRequest
+        :param config: Any keyword arguments
+        :return: The AsyncHttpResponse
+        :rtype: ~azure.core.pipeline.transport.AsyncHttpResponse
+
+        :keyword bool stream: Defaults to False.
+        :keyword dict proxies: dict of proxy to used based on protocol. Proxy is a dict (protocol, url)
+        """
+        await self.open()
+        proxy = None
+        proxies = config.pop('proxies', None)
+        if proxies:
+            # Sort by longest string first, so "http" is not used for "https" ;-)
+            for protocol in sorted(proxies.keys(), reverse=True):
+                if request.url.startswith(protocol):
+                    proxy = proxies[protocol]
+                    break
+        elif self._env_proxies:
+            proxy = self._get_env_proxy(request.url)
+        session = self._get_proxy_session(proxy) if proxy else self.session
+        for setting in ('connection_verify', 'connection_cert'):
+            value = config.pop(setting, None)
+            if value is not None and value != getattr(self.connection_config, setting[len('connection_'):]):
+                raise ValueError("{} must be configured when creating TrioHttpxTransport".format(setting))
+
+        stream_response = config.pop("stream", False)
+        timeout = config.pop('connection_timeout', self.connection_config.timeout)
+        read_timeout = config.pop('read_timeout', self.connection_config.read_timeout)
+        if isinstance(request.data, dict):
+            content, data = None, request.data
+        else:
+            content, data = _get_content(request.data, self.connection_config.data_block_size), None
+        try:
+            result = await session.send(  # type: ignore
+                session.build_request(  # type: ignore
+                    request.method,
+                    request.url,
+                    headers=request.headers,
+                    content=content,
+                    data=data,
+                    files=request.files,
+                    timeout=httpx.Timeout(read_timeout, connect=timeout),
+                ),
+                stream=True,
+                follow_redirects=False,
+            )
+        except (httpx.ConnectError, httpx.ConnectTimeout) as err:
+            raise ServiceRequestError(err, error=err) from err
+        except (httpx.ReadTimeout, httpx.ReadError, httpx.RemoteProtocolError) as err:
+            raise ServiceResponseError(err, error=err) from err
+        except httpx.HTTPError as err:
+            raise ServiceRequestError(err, error=err) from err
+
+        response = TrioHttpxTransportResponse(request, result, self.connection_config.data_block_size)
+        if not stream_response:
+            # The service got the request, failing to read the response must not look like a connection error
+            try:
+                await response.load_body()
+            except httpx.DecodingError as err:
+                raise DecodeError(err, response=response, error=err) from err
+            except httpx.HTTPError as err:
+                raise ServiceResponseError(err, error=err) from err
+        return response
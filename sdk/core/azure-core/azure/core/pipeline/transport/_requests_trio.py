@@ -23,10 +23,10 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+from collections import deque
 from collections.abc import AsyncIterator
-import functools
 import logging
-from typing import Any, Callable, Union, Optional, AsyncIterator as AsyncIteratorType
+from typing import Any, Callable, Deque, Union, Optional, AsyncIterator as AsyncIteratorType
 import trio
 import urllib3
 
@@ -38,10 +38,7 @@ from azure.core.exceptions import (
 )
 from azure.core.pipeline import Pipeline
 from ._base import HttpRequest
-from ._base_async import (
-    AsyncHttpResponse,
-    _ResponseStopIteration,
-    _iterate_response_content)
+from ._base_async import AsyncHttpResponse
 from ._requests_basic import RequestsTransportResponse, _read_raw_stream
 from ._base_requests_async import RequestsAsyncTransportBase
 from .._tools import get_block_size as _get_block_size, get_internal_response as _get_internal_response
@@ -49,6 +46,37 @@ from .._tools import get_block_size as _get_block_size, get_internal_response as
 
 _LOGGER = logging.getLogger(__name__)
 
+# Minimum amount of data pulled from the response in a worker thread before handing back to trio
+_MIN_BYTES_PER_THREAD_HOP = 64 * 1024
+
+_run_sync = trio.to_thread.run_sync
+
+
+def _read_chunks(iterator, min_bytes):
+    """Read chunks from the iterator until at least min_bytes are read or the iterator is exhausted.
+    """
+    chunks = []
+    total = 0
+    for chunk in iterator:
+        if not chunk:
+            break
+        chunks.append(chunk)
+        total += len(chunk)
+        if total >= min_bytes:
+            break
+    return chunks
+
+
+def _is_identity_stream(internal_response):
+    """Whether the response body is still unread and not content-encoded, so there is nothing to decompress.
+    """
+    # pylint: disable=protected-access
+    if internal_response._content_consumed:
+        # Let iter_content replay the cached body or raise StreamConsumedError
+        return False
+    content_encoding = internal_response.headers.get('Content-Encoding', '')
+    return content_encoding.strip().lower() in ('', 'identity')
+
 
 class TrioStreamDownloadGenerator(AsyncIterator):
     """Generator for streaming response data.
@@ -66,41 +94,36 @@ class TrioStreamDownloadGenerator(AsyncIterator):
         decompress = kwargs.pop("decompress", True)
         if len(kwargs) > 0:
             raise TypeError("Got an unexpected keyword argument: {}".format(list(kwargs.keys())[0]))
-        internal_response = _get_internal_response(response)
-        if decompress:
-            self.iter_content_func = internal_response.iter_content(self.block_size)
+        self._internal_response = _get_internal_response(response)
+        if decompress and not _is_identity_stream(self._internal_response):
+            self.iter_content_func = self._internal_response.iter_content(self.block_size)
         else:
-            self.iter_content_func = _read_raw_stream(internal_response, self.block_size)
+            self.iter_content_func = _read_raw_stream(self._internal_response, self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
+        # Chunks are read by batches in a worker thread, and then served from this buffer
+        self._chunks = deque()  # type: Deque[bytes]
+        self._min_bytes_per_thread_hop = max(self.block_size, _MIN_BYTES_PER_THREAD_HOP)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
-        internal_response = _get_internal_response(self.response)
-        try:
+        buffered_chunks = self._chunks
+        if not buffered_chunks:
+            # Only the thread hop can fail, buffered chunks are served without any exception handling
             try:
-                chunk = await trio.to_thread.run_sync(
-                    _iterate_response_content,
-                    self.iter_content_func,
-                )
-            except AttributeError:  # trio < 0.12.1
-                chunk = await trio.run_sync_in_worker_thread(  # pylint: disable=no-member
-                    _iterate_response_content,
-                    self.iter_content_func,
-                )
-            if not chunk:
-                raise _ResponseStopIteration()
-            return chunk
-        except _ResponseStopIteration:
-            internal_response.close()
-            raise StopAsyncIteration()
-        except requests.exceptions.StreamConsumedError:
-            raise
-        except Exception as err:
-            _LOGGER.warning("Unable to stream download: %s", err)
-            internal_response.close()
-            raise
+                chunks = await _run_sync(_read_chunks, self.iter_content_func, self._min_bytes_per_thread_hop)
+            except requests.exceptions.StreamConsumedError:
+                raise
+            except Exception as err:
+                _LOGGER.warning("Unable to stream download: %s", err)
+                self._internal_response.close()
+                raise
+            if not chunks:
+                self._internal_response.close()
+                raise StopAsyncIteration()
+            buffered_chunks.extend(chunks)
+        return buffered_chunks.popleft()
 
 class TrioRequestsTransportResponse(AsyncHttpResponse, RequestsTransportResponse):  # type: ignore
     """Asynchronous streaming of data from the response.
@@ -133,6 +156,20 @@ class TrioRequestsTransport(RequestsAsyncTransportBase):  # type: ignore
     async def sleep(self, duration):  # pylint:disable=invalid-overridden-method
         await trio.sleep(duration)
 
+    def _send_request(self, request, data, verify, timeout, cert, kwargs):  # pylint: disable=too-many-arguments
+        # trio.to_thread.run_sync only forwards positional arguments
+        return self.session.request(  # type: ignore
+            request.method,
+            request.url,
+            headers=request.headers,
+            data=data,
+            files=request.files,
+            verify=verify,
+            timeout=timeout,
+            cert=cert,
+            allow_redirects=False,
+            **kwargs)
+
     async def send(self, request: HttpRequest, **kwargs: Any) -> AsyncHttpResponse:  # type: ignore # pylint:disable=invalid-overridden-method
         """Send the request using this HTTP sender.
 
@@ -146,41 +183,20 @@ class TrioRequestsTransport(RequestsAsyncTransportBase):  # type: ignore
         :keyword dict proxies: will define the proxy to use. Proxy is a dict (protocol, url)
         """
         self.open()
-        trio_limiter = kwargs.get("trio_limiter", None)
+        trio_limiter = kwargs.pop("trio_limiter", None)
         response = None
         error = None # type: Optional[Union[ServiceRequestError, ServiceResponseError]]
         data_to_send = await self._retrieve_request_data(request)
         try:
-            try:
-                response = await trio.to_thread.run_sync(
-                    functools.partial(
-                        self.session.request,
-                        request.method,
-                        request.url,
-                        headers=request.headers,
-                        data=data_to_send,
-                        files=request.files,
-                        verify=kwargs.pop('connection_verify', self.connection_config.verify),
-                        timeout=kwargs.pop('connection_timeout', self.connection_config.timeout),
-                        cert=kwargs.pop('connection_cert', self.connection_config.cert),
-                        allow_redirects=False,
-                        **kwargs),
-                    limiter=trio_limiter)
-            except AttributeError:  # trio < 0.12.1
-                response = await trio.run_sync_in_worker_thread(  # pylint: disable=no-member
-                    functools.partial(
-                        self.session.request,
-                        request.method,
-                        request.url,
-                        headers=request.headers,
-                        data=request.data,
-                        files=request.files,
-                        verify=kwargs.pop('connection_verify', self.connection_config.verify),
-                        timeout=kwargs.pop('connection_timeout', self.connection_config.timeout),
-                        cert=kwargs.pop('connection_cert', self.connection_config.cert),
-                        allow_redirects=False,
-                        **kwargs),
-                    limiter=trio_limiter)
+            response = await _run_sync(
+                self._send_request,
+                request,
+                data_to_send,
+                kwargs.pop('connection_verify', self.connection_config.verify),
+                kwargs.pop('connection_timeout', self.connection_config.timeout),
+                kwargs.pop('connection_cert', self.connection_config.cert),
+                kwargs,
+                limiter=trio_limiter)
 
         except urllib3.exceptions.NewConnectionError as err:
             error = ServiceRequestError(err, error=err)
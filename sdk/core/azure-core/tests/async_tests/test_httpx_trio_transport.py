@@ -0,0 +1,190 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import io
+import json
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+
+from unittest import mock
+
+from azure.core.exceptions import DecodeError, ServiceRequestError, ServiceResponseError
+from azure.core.pipeline.transport import TrioHttpxTransport, TrioHttpxTransportResponse
+from azure.core.rest import HttpRequest
+from azure.core.rest._httpx_trio import RestTrioHttpxTransportResponse
+from rest_client_async import AsyncTestRestClient
+from utils import HTTP_REQUESTS
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_async_gen_data(port, http_request):
+    class AsyncGen:
+        def __init__(self):
+            self._range = iter([b"azerty"])
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._range)
+            except StopIteration:
+                raise StopAsyncIteration
+
+    async with TrioHttpxTransport() as transport:
+        req = http_request('GET', 'http://localhost:{}/basic/anything'.format(port), data=AsyncGen())
+        response = await transport.send(req)
+        assert json.loads(response.text())['data'] == "azerty"
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_data(port, http_request):
+    async with TrioHttpxTransport() as transport:
+        req = http_request('PUT', 'http://localhost:{}/basic/anything'.format(port), data=b"azerty")
+        response = await transport.send(req)
+
+        assert isinstance(response, TrioHttpxTransportResponse)
+        assert json.loads(response.text())['data'] == "azerty"
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_stream_download(port, http_request):
+    async with TrioHttpxTransport() as transport:
+        req = http_request('GET', 'http://localhost:{}/streams/basic'.format(port))
+        response = await transport.send(req, stream=True)
+        with pytest.raises(ValueError):
+            response.body()
+        content = b"".join([chunk async for chunk in response.stream_download(None)])
+        assert content == b"Hello, world!"
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http2", [True, False])
+async def test_http2_setting(http2):
+    with mock.patch("httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as transport_type:
+        async with TrioHttpxTransport(http2=http2, use_env_settings=False):
+            pass
+    assert transport_type.call_args.kwargs["http2"] is http2
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http2_available", [True, False])
+async def test_http2_default(http2_available):
+    with mock.patch("azure.core.pipeline.transport._httpx_trio._HTTP2_AVAILABLE", http2_available):
+        with mock.patch("httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as transport_type:
+            async with TrioHttpxTransport(use_env_settings=False):
+                pass
+    assert transport_type.call_args.kwargs["http2"] is http2_available
+
+def _mock_create_transport(handler):
+    def create_transport(self, proxy=None):
+        async def mock_handler(request):
+            return await handler(request, proxy)
+        return httpx.MockTransport(mock_handler)
+    return mock.patch.object(TrioHttpxTransport, "_create_transport", create_transport)
+
+async def _proxy_handler(request, proxy):
+    return httpx.Response(200, headers={"x-proxy": proxy or "none"})
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_env_proxies(monkeypatch, http_request):
+    monkeypatch.setenv("HTTP_PROXY", "http://localhost:1")
+    monkeypatch.setenv("NO_PROXY", "localhost")
+    with _mock_create_transport(_proxy_handler):
+        async with TrioHttpxTransport() as transport:
+            response = await transport.send(http_request("GET", "http://example.org/"))
+            assert response.headers["x-proxy"] == "http://localhost:1"
+            response = await transport.send(http_request("GET", "http://localhost/"))
+            assert response.headers["x-proxy"] == "none"
+            response = await transport.send(
+                http_request("GET", "http://example.org/"), proxies={"http": "http://localhost:2"}
+            )
+            assert response.headers["x-proxy"] == "http://localhost:2"
+        async with TrioHttpxTransport(use_env_settings=False) as transport:
+            response = await transport.send(http_request("GET", "http://example.org/"))
+            assert response.headers["x-proxy"] == "none"
+
+async def _echo_handler(request, proxy):
+    return httpx.Response(200, content=await request.aread())
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_file_data(http_request):
+    with _mock_create_transport(_echo_handler):
+        async with TrioHttpxTransport(use_env_settings=False) as transport:
+            req = http_request("PUT", "http://example.org/")
+            req.set_streamed_data_body(io.BytesIO(b"azerty" * 1000))
+            response = await transport.send(req)
+            assert response.body() == b"azerty" * 1000
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_generator_data(http_request):
+    def data():
+        yield b"aze"
+        yield b"rty"
+
+    with _mock_create_transport(_echo_handler):
+        async with TrioHttpxTransport(use_env_settings=False) as transport:
+            req = http_request("PUT", "http://example.org/")
+            req.set_streamed_data_body(data())
+            response = await transport.send(req)
+            assert response.body() == b"azerty"
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_decode_error(http_request):
+    async def handler(request, proxy):
+        # A stream is only decoded when the body is read, after the service answered
+        return httpx.Response(200, headers={"Content-Encoding": "gzip"}, stream=httpx.ByteStream(b"not gzip"))
+
+    with _mock_create_transport(handler):
+        async with TrioHttpxTransport(use_env_settings=False) as transport:
+            with pytest.raises(DecodeError):
+                await transport.send(http_request("POST", "http://example.org/", data=b"azerty"))
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_proxies(http_request):
+    async with TrioHttpxTransport(use_env_settings=False) as transport:
+        req = http_request('GET', 'http://example.org/')
+        with pytest.raises(ServiceRequestError):
+            await transport.send(req, proxies={"https": "http://localhost:2", "http": "http://localhost:1"})
+        assert list(transport._proxy_sessions) == ["http://localhost:1"]
+    assert not transport._proxy_sessions
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_stream_download_error(http_request):
+    class BrokenStream(httpx.AsyncByteStream):
+        async def __aiter__(self):
+            yield b"Hello"
+            raise httpx.ReadError("connection reset")
+
+    httpx_response = httpx.Response(200, stream=BrokenStream(), request=httpx.Request("GET", "http://example.org/"))
+    response = TrioHttpxTransportResponse(http_request("GET", "http://example.org/"), httpx_response)
+    with pytest.raises(ServiceResponseError):
+        async for _ in response.stream_download(None):
+            pass
+    assert httpx_response.is_closed
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_connection_error(http_request):
+    async with TrioHttpxTransport() as transport:
+        req = http_request('GET', 'http://localhost:1/')
+        with pytest.raises(ServiceRequestError):
+            await transport.send(req)
+
+@pytest.mark.trio
+async def test_rest_response(port):
+    async with TrioHttpxTransport() as transport:
+        client = AsyncTestRestClient(port, transport=transport)
+        response = await client.send_request(HttpRequest("GET", "/health"))
+        response.raise_for_status()
+
+    assert isinstance(response, RestTrioHttpxTransportResponse)
@@ -5,10 +5,13 @@
 # -------------------------------------------------------------------------
 import json
 
+import requests
 from azure.core.pipeline.transport import TrioRequestsTransport
 from utils import HTTP_REQUESTS
 
 import pytest
+import trio
+from unittest import mock
 
 
 @pytest.mark.trio
@@ -39,4 +42,78 @@ async def test_send_data(port, http_request):
         req = http_request('PUT', 'http://localhost:{}/basic/anything'.format(port), data=b"azerty")
         response = await transport.send(req)
 
-        assert json.loads(response.text())['data'] == "azerty"
\ No newline at end of file
+        assert json.loads(response.text())['data'] == "azerty"
+
+
+@pytest.mark.trio
+async def test_session_per_transport():
+    async with TrioRequestsTransport() as transport1:
+        async with TrioRequestsTransport() as transport2:
+            assert transport1.session is not transport2.session
+            assert transport1.session.get_adapter("https://") is not transport2.session.get_adapter("https://")
+        assert transport2.session is None
+        adapter = transport1.session.get_adapter("https://")
+        assert adapter.poolmanager.connection_pool_kw["maxsize"] == 100
+    assert transport1.session is None
+
+
+@pytest.mark.trio
+async def test_share_connection_pool():
+    async with TrioRequestsTransport(share_connection_pool=True) as transport1:
+        adapter = transport1.session.get_adapter("https://")
+        with mock.patch.object(adapter, "close", wraps=adapter.close) as adapter_close:
+            async with TrioRequestsTransport(share_connection_pool=True) as transport2:
+                assert transport1.session is not transport2.session
+                assert transport2.session.get_adapter("https://") is adapter
+                transport2.session.headers["x-ms-test"] = "value"
+                transport2.session.cookies.set("cookie", "value")
+                assert "x-ms-test" not in transport1.session.headers
+                assert "cookie" not in transport1.session.cookies
+            # Closing a transport must not close the pool still used by the other one
+            adapter_close.assert_not_called()
+            assert transport1.session.get_adapter("https://") is adapter
+            await transport1.__aexit__()
+            adapter_close.assert_called_once_with()
+    assert transport1.session is None
+
+    async with TrioRequestsTransport(share_connection_pool=True) as transport:
+        assert transport.session.get_adapter("https://") is not adapter
+
+
+@pytest.mark.trio
+async def test_share_connection_pool_tls_settings():
+    async with TrioRequestsTransport(share_connection_pool=True) as transport1:
+        async with TrioRequestsTransport(share_connection_pool=True, connection_verify=False) as transport2:
+            async with TrioRequestsTransport(share_connection_pool=True, connection_cert=["cert", "key"]) as transport3:
+                async with TrioRequestsTransport(share_connection_pool=True, connection_cert=("cert", "key")) as transport4:
+                    adapters = [t.session.get_adapter("https://") for t in (transport1, transport2, transport3)]
+                    assert len(set(map(id, adapters))) == 3
+                    assert transport4.session.get_adapter("https://") is adapters[2]
+            async with TrioRequestsTransport(share_connection_pool=True, connection_verify=False) as transport5:
+                assert transport5.session.get_adapter("https://") is adapters[1]
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("share_connection_pool", [True, False])
+async def test_caller_session(share_connection_pool):
+    session = mock.Mock(spec=requests.Session)
+    async with TrioRequestsTransport(share_connection_pool=True):
+        async with TrioRequestsTransport(session=session, share_connection_pool=share_connection_pool) as transport:
+            assert transport.session is session
+        session.close.assert_called_once_with()
+        session.mount.assert_not_called()
+
+    session = mock.Mock(spec=requests.Session)
+    async with TrioRequestsTransport(session=session, session_owner=False):
+        pass
+    session.close.assert_not_called()
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("http_request", HTTP_REQUESTS)
+async def test_send_with_trio_limiter(port, http_request):
+    async with TrioRequestsTransport() as transport:
+        req = http_request('PUT', 'http://localhost:{}/basic/anything'.format(port), data=b"azerty")
+        response = await transport.send(req, trio_limiter=trio.CapacityLimiter(1))
+
+        assert json.loads(response.text())['data'] == "azerty"
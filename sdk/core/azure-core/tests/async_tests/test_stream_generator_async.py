@@ -11,8 +11,10 @@ from azure.core.pipeline.transport import (
 )
 from azure.core.pipeline import AsyncPipeline, PipelineResponse
 from azure.core.pipeline.transport._aiohttp import AioHttpStreamDownloadGenerator
+from azure.core.pipeline.transport._requests_trio import TrioRequestsTransportResponse
 from unittest import mock
 import pytest
+import trio
 from utils import HTTP_REQUESTS
 
 @pytest.mark.asyncio
@@ -132,3 +134,65 @@ async def test_response_streaming_error_behavior():
     with pytest.raises(requests.exceptions.ConnectionError):
         while True:
             await downloader.__anext__()
+
+
+@pytest.mark.trio
+async def test_trio_response_streaming_batches_thread_hops():
+    block_size = 1024
+    total_response_size = 200 * 1024
+    req_response = requests.Response()
+    req_request = requests.Request()
+
+    class FakeStream:
+        # fake object for urllib3.response.HTTPResponse
+        def stream(self, chunk_size, decode_content=False):
+            assert chunk_size == block_size
+            for _ in range(total_response_size // chunk_size):
+                yield b"X" * chunk_size
+
+        def close(self):
+            pass
+
+    req_response.raw = FakeStream()
+
+    response = TrioRequestsTransportResponse(
+        req_request,
+        req_response,
+        block_size,
+    )
+    with mock.patch("azure.core.pipeline.transport._requests_trio._run_sync", wraps=trio.to_thread.run_sync) as run_sync:
+        chunks = [chunk async for chunk in response.stream_download(None, decompress=False)]
+    assert len(chunks) == total_response_size // block_size
+    assert all(chunk == b"X" * block_size for chunk in chunks)
+    # 64KB are read per thread hop, plus one last hop to detect the end of the stream
+    assert run_sync.call_count == 5
+
+
+@pytest.mark.trio
+@pytest.mark.parametrize("content_encoding,decode_content", [(None, False), ("identity", False), ("gzip", True)])
+async def test_trio_response_streaming_skips_decoding_identity(content_encoding, decode_content):
+    block_size = 1024
+    req_response = requests.Response()
+    req_request = requests.Request()
+    if content_encoding:
+        req_response.headers["Content-Encoding"] = content_encoding
+
+    class FakeStream:
+        # fake object for urllib3.response.HTTPResponse
+        def stream(self, chunk_size, decode_content=False):
+            self.decode_content = decode_content
+            yield b"X" * chunk_size
+
+        def close(self):
+            pass
+
+    req_response.raw = FakeStream()
+
+    response = TrioRequestsTransportResponse(
+        req_request,
+        req_response,
+        block_size,
+    )
+    chunks = [chunk async for chunk in response.stream_download(None)]
+    assert chunks == [b"X" * block_size]
+    assert req_response.raw.decode_content is decode_content
@@ -250,6 +250,19 @@ def test_raw_deserializer(http_request):
     result = response.context["deserialized_data"]
     assert result["success"] is True
 
+    # JSON the standard library accepts, but a strict parser may not
+    response = build_response(b'{"nan": NaN, "big": 123456789012345678901234567890}', content_type="application/json")
+    raw_deserializer.on_response(request, response)
+    result = response.context["deserialized_data"]
+    assert result["nan"] != result["nan"]
+    assert result["big"] == 123456789012345678901234567890
+
+    # Invalid JSON
+    response = build_response(b'{"success": tru', content_type="application/json")
+    with pytest.raises(DecodeError) as err:
+        raw_deserializer.on_response(request, response)
+    assert err.value.response is response.http_response
+
     # Simple JSON with BOM
     response = build_response(b'\xef\xbb\xbf{"success": true}', content_type="application/json")
     raw_deserializer.on_response(request, response)
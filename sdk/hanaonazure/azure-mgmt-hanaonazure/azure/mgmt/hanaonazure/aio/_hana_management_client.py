@@ -21,6 +21,9 @@ from .operations import SapMonitorsOperations
 from .operations import ProviderInstancesOperations
 from .. import models
 
+# Model classes don't change at runtime, the table given to Serializer/Deserializer is built once
+_CLIENT_MODELS = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+
 
 class HanaManagementClient(object):
     """HANA on Azure Client.
@@ -51,7 +54,7 @@ class HanaManagementClient(object):
         self._config = HanaManagementClientConfiguration(credential, subscription_id, **kwargs)
         self._client = AsyncARMPipelineClient(base_url=base_url, config=self._config, **kwargs)
 
-        client_models = {k: v for k, v in models.__dict__.items() if isinstance(v, type)}
+        client_models = _CLIENT_MODELS
         self._serialize = Serializer(client_models)
         self._serialize.client_side_validation = False
         self._deserialize = Deserializer(client_models)
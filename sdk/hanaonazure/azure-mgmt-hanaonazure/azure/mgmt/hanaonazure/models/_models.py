@@ -278,7 +278,11 @@ class ProviderInstance(ProxyResource):
         self,
         **kwargs
     ):
-        super(ProviderInstance, self).__init__(**kwargs)
+        # Inlined ProxyResource/Resource initialization, this model is built for every item of list responses
+        msrest.serialization.Model.__init__(self, **kwargs)
+        self.id = None
+        self.name = None
+        self.type = None
         self.type_properties_type = kwargs.get('type_properties_type', None)
         self.properties = kwargs.get('properties', None)
         self.metadata = kwargs.get('metadata', None)
@@ -425,7 +429,13 @@ class SapMonitor(TrackedResource):
         self,
         **kwargs
     ):
-        super(SapMonitor, self).__init__(**kwargs)
+        # Inlined TrackedResource/Resource initialization, this model is built for every item of list responses
+        msrest.serialization.Model.__init__(self, **kwargs)
+        self.id = None
+        self.name = None
+        self.type = None
+        self.tags = kwargs.get('tags', None)
+        self.location = kwargs['location']
         self.provisioning_state = None
         self.managed_resource_group_name = None
         self.log_analytics_workspace_arm_id = kwargs.get('log_analytics_workspace_arm_id', None)
@@ -290,7 +290,11 @@ class ProviderInstance(ProxyResource):
         metadata: Optional[str] = None,
         **kwargs
     ):
-        super(ProviderInstance, self).__init__(**kwargs)
+        # Inlined ProxyResource/Resource initialization, this model is built for every item of list responses
+        msrest.serialization.Model.__init__(self, **kwargs)
+        self.id = None
+        self.name = None
+        self.type = None
         self.type_properties_type = type_properties_type
         self.properties = properties
         self.metadata = metadata
@@ -451,7 +455,13 @@ class SapMonitor(TrackedResource):
         monitor_subnet: Optional[str] = None,
         **kwargs
     ):
-        super(SapMonitor, self).__init__(tags=tags, location=location, **kwargs)
+        # Inlined TrackedResource/Resource initialization, this model is built for every item of list responses
+        msrest.serialization.Model.__init__(self, **kwargs)
+        self.id = None
+        self.name = None
+        self.type = None
+        self.tags = tags
+        self.location = location
         self.provisioning_state = None
         self.managed_resource_group_name = None
         self.log_analytics_workspace_arm_id = log_analytics_workspace_arm_id